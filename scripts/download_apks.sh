@@ -13,13 +13,27 @@ apk_files=( \
   com.projectsexception.myapplist.open_16.apk \
 )
 
-echo "--- Downloading F-Droid app market APK..."
-cd ${BASEDIR}/system/priv-app
-wget --no-verbose --continue https://f-droid.org/repo/org.fdroid.fdroid_760.apk
+# The standalone downloads below run in the background alongside the
+# F-Droid package batch, and are waited on before finishing. Background
+# jobs ignore SIGINT in a non-interactive shell, so kill them ourselves
+# if the script is interrupted.
+pids=()
+names=()
+trap 'kill "${pids[@]}" 2>/dev/null' EXIT
+trap 'exit 130' INT TERM
 
-echo "--- Downloading Orfox browser debug APK..."
-cd ${BASEDIR}/data/app
-wget --no-verbose --continue "https://guardianproject.info/builds/OrfoxFennec/latest/OrfoxFennec-debug.apk"
+echo "--- Starting F-Droid app market and Orfox browser APK downloads in the background..."
+
+wget --no-verbose --continue --directory-prefix=${BASEDIR}/system/priv-app \
+  https://f-droid.org/repo/org.fdroid.fdroid_760.apk &
+pids+=($!)
+names+=("F-Droid app market APK")
+
+wget --no-verbose --timestamping --no-if-modified-since \
+  --directory-prefix=${BASEDIR}/data/app \
+  "https://guardianproject.info/builds/OrfoxFennec/latest/OrfoxFennec-debug.apk" &
+pids+=($!)
+names+=("Orfox browser debug APK")
 
 echo "--- Downloading ${#apk_files[@]} F-Droid packages..."
 echo "    This is parallel, but may still take awhile."
@@ -29,5 +43,25 @@ cd ${BASEDIR}/data/app
 printf "%s\n" "${apk_files[@]}" \
   | xargs --max-args=1 --max-procs=8 -i \
     wget --no-verbose --continue https://f-droid.org/repo/{}
+status=$?
+
+if [ $status -ne 0 ]; then
+  echo "--- Some F-Droid packages failed to download!"
+fi
+
+for i in "${!pids[@]}"; do
+  if wait ${pids[$i]}; then
+    echo "--- Downloaded ${names[$i]}."
+  else
+    echo "--- Failed to download ${names[$i]}!"
+    status=1
+  fi
+done
+
+trap - EXIT INT TERM
+
+if [ $status -ne 0 ]; then
+  exit $status
+fi
 
 echo "--- All packages downloaded!"